@@ -0,0 +1,76 @@
+"""
+Persistent AI response cache for codectx
+
+This module keeps AI summaries on disk so unchanged content is never sent
+to the API twice, even across runs:
+- SQLite-backed store keyed by model, file path, content checksum and prompt version
+- Lazy connection opening (no cache file is created until first use)
+- Thread-safe access for concurrent file processing
+
+Entries are never pruned; delete the cache file to reclaim space.
+"""
+import hashlib
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+from .constants import PROMPT_VERSION
+
+
+class SummaryCache:
+    """On-disk cache of AI summaries keyed by (model, file path, checksum, prompt version)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(model: str, file_path: str, checksum: str) -> str:
+        """Build the cache key for a model, file path and content checksum"""
+        # The prompt names the file, so identical content at another path gets its own summary
+        return hashlib.sha256(f"{model}|{file_path}|{checksum}|{PROMPT_VERSION}".encode('utf-8')).hexdigest()
+
+    def get(self, model: str, file_path: str, checksum: str) -> Optional[str]:
+        """Return the cached summary, or None on a miss"""
+        key = self.make_key(model, file_path, checksum)
+        try:
+            with self._lock:
+                row = self._connect().execute(
+                    "SELECT summary FROM cache WHERE key = ?", (key,)
+                ).fetchone()
+        except sqlite3.Error:
+            return None  # A broken cache behaves like an empty one
+
+        return row[0] if row else None
+
+    def put(self, model: str, file_path: str, checksum: str, summary: str) -> None:
+        """Store a summary in the cache"""
+        key = self.make_key(model, file_path, checksum)
+        try:
+            with self._lock:
+                connection = self._connect()
+                with connection:
+                    connection.execute(
+                        "INSERT OR REPLACE INTO cache (key, summary, ts) VALUES (?, ?, ?)",
+                        (key, summary, int(time.time()))
+                    )
+        except sqlite3.Error:
+            pass  # Caching is best-effort, never fail processing because of it
+
+    def close(self) -> None:
+        """Close the database connection if it was opened"""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use and make sure the table exists"""
+        if self._connection is None:
+            self._connection = sqlite3.connect(self.path, check_same_thread=False)
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, summary TEXT, ts INTEGER)"
+            )
+        return self._connection
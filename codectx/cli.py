@@ -11,12 +11,12 @@ This module provides the main entry point and command-line interface:
 import os
 import argparse
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, List, Optional, Tuple
 
 from . import __version__
-from .discovery import discover_files
-from .processing import FileProcessor, ProcessingConfig, ProcessingMode
-from .constants import DEFAULT_API_URL, DEFAULT_MODEL, DEFAULT_TOKEN_THRESHOLD, DEFAULT_TIMEOUT, DEFAULT_RETRY_ATTEMPTS, DEFAULT_MAX_FILE_SIZE_MB, DEFAULT_OUTPUT_FILE
+from .discovery import discover_files, FileInfo
+from .processing import FileProcessor, ProcessingConfig, ProcessingMode, in_input_order
+from .constants import DEFAULT_API_URL, DEFAULT_MODEL, DEFAULT_TOKEN_THRESHOLD, DEFAULT_TIMEOUT, DEFAULT_RETRY_ATTEMPTS, DEFAULT_MAX_FILE_SIZE_MB, DEFAULT_OUTPUT_FILE, DEFAULT_MAX_CONCURRENCY, DEFAULT_CACHE_FILE
 from .ui import (
     display_welcome, display_info, display_success, display_warning, display_error,
     display_file_stats, display_file_table, display_processing_progress, 
@@ -132,6 +132,17 @@ Examples:
         default=DEFAULT_OUTPUT_FILE,
         help=f'Output filename (default: {DEFAULT_OUTPUT_FILE})'
     )
+    parser.add_argument(
+        '--max-concurrency',
+        type=_positive_int,
+        default=DEFAULT_MAX_CONCURRENCY,
+        help=f'Maximum number of files processed in parallel (default: {DEFAULT_MAX_CONCURRENCY})'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help=f'Disable the on-disk AI response cache ({DEFAULT_CACHE_FILE})'
+    )
     
     # Info arguments
     parser.add_argument(
@@ -143,6 +154,17 @@ Examples:
     return parser.parse_args()
 
 
+def _positive_int(value: str) -> int:
+    """Argparse type for options that must be at least 1"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 def _create_config(args: argparse.Namespace) -> ProcessingConfig:
     """Create processing configuration from arguments"""
     # Determine processing mode
@@ -167,7 +189,9 @@ def _create_config(args: argparse.Namespace) -> ProcessingConfig:
         timeout=args.timeout,
         retry_attempts=args.retry_attempts,
         max_file_size_mb=args.max_file_size,
-        output_file=args.output_file
+        output_file=args.output_file,
+        max_concurrency=args.max_concurrency,
+        cache_file=None if args.no_cache else DEFAULT_CACHE_FILE
     )
 
 
@@ -183,11 +207,11 @@ def _run_status_mode(directory: str, config: ProcessingConfig) -> None:
         return
     
     # Get file status
-    processor = FileProcessor(config)
-    file_status = processor.get_file_status(discovery.files_to_process)
-    
-    # Display status summary
-    display_status_summary(discovery, file_status)
+    with FileProcessor(config) as processor:
+        file_status = processor.get_file_status(discovery.files_to_process)
+        
+        # Display status summary
+        display_status_summary(discovery, file_status)
 
 
 def _run_update_mode(directory: str, config: ProcessingConfig) -> None:
@@ -211,62 +235,46 @@ def _run_update_mode(directory: str, config: ProcessingConfig) -> None:
         return
     
     # Get file status and filter to outdated files
-    processor = FileProcessor(config)
-    file_status = processor.get_file_status(discovery.files_to_process)
-    
-    outdated_files = [
-        f for f in discovery.files_to_process
-        if file_status[f.relative_path] in ["outdated", "new"]
-    ]
-    
-    display_info("Checking for existing summaries...")
-    display_file_stats(discovery, file_status)
-    
-    if not outdated_files:
-        display_info("✅ All files are up to date!")
-        return
-    
-    # Show files to be processed
-    if len(outdated_files) <= 10:
-        display_file_table(outdated_files, file_status, f"📂 Files to Update ({len(outdated_files)} files)")
-    else:
-        display_info(f"📋 Updating {len(outdated_files)} files...")
-    
-    # Show processing mode
-    mode_messages = {
-        ProcessingMode.MOCK: "🤖 Running in mock mode (no API calls)",
-        ProcessingMode.COPY: "📄 Running in copy mode (raw content only)",
-        ProcessingMode.AI_SUMMARIZATION: "🤖 Running AI summarization"
-    }
-    display_info(mode_messages[config.mode])
-    
-    # Process files with live table display
-    display_info(f"🚀 Updating {len(outdated_files)} files...")
-    
-    summaries = []
-    with create_live_processing_context(outdated_files, discovery.directory) as live_ctx:
-        for file_info in outdated_files:
-            # Update file status to processing
-            live_ctx.update_file_status(file_info, 'processing')
-            
-            # Process the file
-            summary = processor._process_single_file(file_info)
-            if summary:
-                summaries.append(summary)
-                live_ctx.update_file_status(file_info, 'completed')
-            else:
-                live_ctx.update_file_status(file_info, 'error')
-            
-            # Advance progress
-            live_ctx.advance_progress()
-    
-    # Write output (pass current files to remove summaries of deleted files)
-    display_info("📝 Writing output...")
-    processor.write_output(summaries, discovery.files_to_process)
-    
-    # Show completion stats
-    up_to_date_count = len([f for f in discovery.files_to_process if file_status[f.relative_path] == "up-to-date"])
-    display_completion_stats(len(summaries), config.output_file, up_to_date_count)
+    with FileProcessor(config) as processor:
+        file_status = processor.get_file_status(discovery.files_to_process)
+        
+        outdated_files = [
+            f for f in discovery.files_to_process
+            if file_status[f.relative_path] in ["outdated", "new"]
+        ]
+        
+        display_info("Checking for existing summaries...")
+        display_file_stats(discovery, file_status)
+        
+        if not outdated_files:
+            display_info("✅ All files are up to date!")
+            return
+        
+        # Show files to be processed
+        if len(outdated_files) <= 10:
+            display_file_table(outdated_files, file_status, f"📂 Files to Update ({len(outdated_files)} files)")
+        else:
+            display_info(f"📋 Updating {len(outdated_files)} files...")
+        
+        # Show processing mode
+        mode_messages = {
+            ProcessingMode.MOCK: "🤖 Running in mock mode (no API calls)",
+            ProcessingMode.COPY: "📄 Running in copy mode (raw content only)",
+            ProcessingMode.AI_SUMMARIZATION: "🤖 Running AI summarization"
+        }
+        display_info(mode_messages[config.mode])
+        
+        # Process files with live table display
+        display_info(f"🚀 Updating {len(outdated_files)} files...")
+        
+        # Summaries stream into the output (current files drop summaries of deleted files)
+        processed_count = _process_with_live_display(
+            processor, outdated_files, discovery.directory, discovery.files_to_process
+        )
+        
+        # Show completion stats (every file not outdated/new is up to date)
+        up_to_date_count = len(discovery.files_to_process) - len(outdated_files)
+        display_completion_stats(processed_count, config.output_file, up_to_date_count)
 
 
 def _run_scan_all_mode(directory: str, config: ProcessingConfig) -> None:
@@ -290,51 +298,60 @@ def _run_scan_all_mode(directory: str, config: ProcessingConfig) -> None:
         return
     
     # Get file status for display
-    processor = FileProcessor(config)
-    file_status = processor.get_file_status(discovery.files_to_process)
-    
-    display_file_stats(discovery, file_status)
-    
-    # Show files to be processed
-    if len(discovery.files_to_process) <= 10:
-        display_file_table(discovery.files_to_process, file_status, f"📂 All Files ({len(discovery.files_to_process)} files)")
-    else:
-        display_info(f"📋 Processing {len(discovery.files_to_process)} files...")
-    
-    # Show processing mode
-    mode_messages = {
-        ProcessingMode.MOCK: "🤖 Running in mock mode (no API calls)",
-        ProcessingMode.COPY: "📄 Running in copy mode (raw content only)",
-        ProcessingMode.AI_SUMMARIZATION: "🤖 Running AI summarization"
-    }
-    display_info(mode_messages[config.mode])
-    
-    # Process all files with live table display
-    display_info(f"🚀 Processing {len(discovery.files_to_process)} files...")
-    
-    summaries = []
-    with create_live_processing_context(discovery.files_to_process, discovery.directory) as live_ctx:
-        for file_info in discovery.files_to_process:
-            # Update file status to processing
-            live_ctx.update_file_status(file_info, 'processing')
-            
-            # Process the file
-            summary = processor._process_single_file(file_info)
-            if summary:
-                summaries.append(summary)
-                live_ctx.update_file_status(file_info, 'completed')
-            else:
-                live_ctx.update_file_status(file_info, 'error')
-            
-            # Advance progress
-            live_ctx.advance_progress()
+    with FileProcessor(config) as processor:
+        file_status = processor.get_file_status(discovery.files_to_process)
+        
+        display_file_stats(discovery, file_status)
+        
+        # Show files to be processed
+        if len(discovery.files_to_process) <= 10:
+            display_file_table(discovery.files_to_process, file_status, f"📂 All Files ({len(discovery.files_to_process)} files)")
+        else:
+            display_info(f"📋 Processing {len(discovery.files_to_process)} files...")
+        
+        # Show processing mode
+        mode_messages = {
+            ProcessingMode.MOCK: "🤖 Running in mock mode (no API calls)",
+            ProcessingMode.COPY: "📄 Running in copy mode (raw content only)",
+            ProcessingMode.AI_SUMMARIZATION: "🤖 Running AI summarization"
+        }
+        display_info(mode_messages[config.mode])
+        
+        # Process all files with live table display
+        display_info(f"🚀 Processing {len(discovery.files_to_process)} files...")
+        
+        processed_count = _process_with_live_display(
+            processor, discovery.files_to_process, discovery.directory, discovery.files_to_process
+        )
+        
+        # Show completion stats
+        display_completion_stats(processed_count, config.output_file)
+
+
+def _process_with_live_display(processor: FileProcessor, files: List[FileInfo], directory: str,
+                               current_files: List[FileInfo]) -> int:
+    """Process files concurrently while keeping the live display up to date, streaming summaries into the output"""
+    summarized = 0
     
-    # Write output
-    display_info("📝 Writing output...")
-    processor.write_output(summaries, discovery.files_to_process)
+    with create_live_processing_context(files, directory) as live_ctx:
+        
+        def track(completed: Iterator[Tuple[FileInfo, Optional[str]]]) -> Iterator[Tuple[FileInfo, Optional[str]]]:
+            # Show each finished file on the live display, passing results through
+            nonlocal summarized
+            for file_info, summary in completed:
+                live_ctx.update_file_status(file_info, 'completed' if summary else 'error')
+                live_ctx.advance_progress()
+                summarized += bool(summary)
+                yield file_info, summary
+        
+        # Only mark a file as processing once a worker is actually free for it
+        completed = processor.iter_completed(
+            files, on_start=lambda file_info: live_ctx.update_file_status(file_info, 'processing')
+        )
+        # Each summary is written as soon as every earlier file has finished
+        processor.write_output(in_input_order(files, track(completed)), current_files)
     
-    # Show completion stats
-    display_completion_stats(len(summaries), config.output_file)
+    return summarized
 
 
 if __name__ == "__main__":
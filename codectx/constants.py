@@ -10,17 +10,32 @@ DEFAULT_API_URL = "https://codestral.mistral.ai/v1/chat/completions"
 DEFAULT_MODEL = "codestral-latest"
 DEFAULT_TIMEOUT = 30.0
 DEFAULT_RETRY_ATTEMPTS = 3
+DEFAULT_MAX_CONCURRENCY = 8
+RETRY_BACKOFF_BASE = 1.0  # Seconds; doubles on each retry
+RETRY_JITTER = 0.5  # Max random seconds added so concurrent retries spread out
+RETRY_MAX_DELAY = 30.0
+RETRY_STATUS_CODES = frozenset([429, 500, 502, 503, 504])  # Rate limiting and transient server errors
 
 # Processing Configuration
 DEFAULT_TOKEN_THRESHOLD = 200
+CHARS_PER_TOKEN = 4  # Rough token estimate for code and prose
 DEFAULT_MAX_FILE_SIZE_MB = 10.0
 DEFAULT_OUTPUT_FILE = "codectx.md"
+SUMMARY_TIMESTAMP_PREFIX = "Summarized on "
+SUMMARY_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+SUMMARY_CHECKSUM_PREFIX = " (checksum: "
+
+# Response Cache
+DEFAULT_CACHE_FILE = ".codectx-cache.db"
+PROMPT_VERSION = 1  # Bump when AI prompts change so cached summaries are not reused
 
 # Mock Processing
 MOCK_PROCESSING_DELAY = 0.5
 
 # File Processing
 CHUNK_SIZE = 4096
+MMAP_THRESHOLD = 256 * 1024  # Files larger than this are memory-mapped for the binary scan
+OUTPUT_BUFFER_SIZE = 1 << 20  # Write buffer for the output file (1 MiB)
 
 # UI Configuration
 DEFAULT_TABLE_WIDTH = 50
@@ -95,6 +110,9 @@ DEFAULT_IGNORE_PATTERNS = {
     
     # Environment files
     ".env", ".env.local", ".env.*.local",
+    
+    # codectx response cache
+    ".codectx-cache.db*",
 }
 
 # AI Prompt Templates
@@ -108,6 +126,15 @@ Format your response EXACTLY as follows:
 
 Keep the summary concise and focused on the most important aspects."""
 
+AI_USER_PROMPT_TEMPLATE = """Please analyze this code file and provide a structured summary.
+
+File: {file_path}
+
+Content:
+```
+{content}
+```"""
+
 MOCK_SUMMARY_TEMPLATE = """- **Role**: This is a mocked summary of the file.
 - **Classes**: None
 - **Global Functions**: None
@@ -8,8 +8,10 @@ This module handles:
 - Comprehensive default ignore patterns for common development files
 """
 import os
+import sys
 import fnmatch
 import hashlib
+from functools import cached_property
 from pathlib import Path
 from typing import List, Set, NamedTuple
 from datetime import datetime
@@ -42,7 +44,7 @@ class FileInfo:
             # If we can't read the file, return a placeholder
             return "unreadable"
     
-    @property
+    @cached_property
     def size_str(self) -> str:
         """Human readable file size"""
         if self.size < 1024:
@@ -52,7 +54,7 @@ class FileInfo:
         else:
             return f"{self.size // (1024 * 1024)}M"
     
-    @property
+    @cached_property
     def modified_str(self) -> str:
         """Human readable modification time"""
         return self.modified_time.strftime("%m-%d %H:%M")
@@ -97,7 +99,8 @@ def discover_files(directory: str = ".") -> DiscoveryResult:
         
         for file in files:
             file_path = os.path.join(root, file)
-            relative_path = os.path.relpath(file_path, directory)
+            # Interned so summary lookups keyed by path can match on identity
+            relative_path = sys.intern(os.path.relpath(file_path, directory))
             
             if _should_ignore(file_path, directory, ignore_patterns):
                 ignored_files.append(relative_path)
@@ -9,21 +9,48 @@ This module handles the main processing pipeline:
 - Checksum-based change detection for efficient updates
 """
 import os
-import re
+import codecs
+import json
+import mmap
+import random
+import sys
 import time
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import InvalidHeader, ReadTimeoutError
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from itertools import takewhile
 from pathlib import Path
-from typing import Dict, List, Optional, NamedTuple
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, NamedTuple, Sequence, Tuple
 from datetime import datetime
 from enum import Enum
 
 from .discovery import FileInfo
+from .cache import SummaryCache
 from .constants import (
-    DEFAULT_API_URL, DEFAULT_MODEL, DEFAULT_TIMEOUT, DEFAULT_RETRY_ATTEMPTS,
-    DEFAULT_TOKEN_THRESHOLD, DEFAULT_MAX_FILE_SIZE_MB, DEFAULT_OUTPUT_FILE,
-    MOCK_PROCESSING_DELAY, CHUNK_SIZE, AI_SYSTEM_PROMPT, MOCK_SUMMARY_TEMPLATE
+    DEFAULT_API_URL, DEFAULT_MODEL, DEFAULT_TIMEOUT, DEFAULT_RETRY_ATTEMPTS, DEFAULT_MAX_CONCURRENCY,
+    RETRY_BACKOFF_BASE, RETRY_JITTER, RETRY_MAX_DELAY, RETRY_STATUS_CODES,
+    DEFAULT_TOKEN_THRESHOLD, CHARS_PER_TOKEN, DEFAULT_MAX_FILE_SIZE_MB, DEFAULT_OUTPUT_FILE, OUTPUT_BUFFER_SIZE, DEFAULT_CACHE_FILE,
+    SUMMARY_TIMESTAMP_PREFIX, SUMMARY_DATE_FORMAT, SUMMARY_CHECKSUM_PREFIX, MOCK_PROCESSING_DELAY, CHUNK_SIZE, MMAP_THRESHOLD, AI_SYSTEM_PROMPT, AI_USER_PROMPT_TEMPLATE, MOCK_SUMMARY_TEMPLATE
 )
 
+# Control bytes that count towards binary detection (everything below 0x20 except \t, \n, \r)
+_CONTROL_BYTES = bytes(b for b in range(32) if b not in b'\t\n\r')
+
+# System message is identical for every request; json.dumps only reads it, so one dict is shared
+_SYSTEM_MESSAGE = {'role': 'system', 'content': AI_SYSTEM_PROMPT}
+
+# Output header line recording how many current files the summary covers
+_TOTAL_FILES_PREFIX = "Total files processed: "
+
+# Where the timestamp sits in a "Summarized on ..." line, derived from the format _format_summary writes
+_DATE_START = len(SUMMARY_TIMESTAMP_PREFIX)
+_DATE_END = _DATE_START + len(datetime(2000, 1, 1).strftime(SUMMARY_DATE_FORMAT))
+
+# Header some AI responses and copied files start with, duplicating our own "## <path>" header
+_FILE_HEADER_PREFIX = "## File: "
+
 
 class ProcessingMode(Enum):
     """Processing mode options"""
@@ -43,11 +70,13 @@ class ProcessingConfig(NamedTuple):
     retry_attempts: int = DEFAULT_RETRY_ATTEMPTS
     max_file_size_mb: float = DEFAULT_MAX_FILE_SIZE_MB
     output_file: str = DEFAULT_OUTPUT_FILE
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    cache_file: Optional[str] = DEFAULT_CACHE_FILE
+    mock_delay: float = MOCK_PROCESSING_DELAY
 
 
 class SummaryMetadata(NamedTuple):
-    """Metadata about an existing summary"""
-    file_path: str
+    """Metadata about an existing summary (keyed by file path in existing_summaries)"""
     summary_date: datetime
     content: str
     checksum: str = None
@@ -59,8 +88,38 @@ class FileProcessor:
     def __init__(self, config: ProcessingConfig):
         self.config = config
         self.existing_summaries: Dict[str, SummaryMetadata] = {}
+        # "Total files processed" count from the existing output header, if any
+        self._existing_total_count: Optional[int] = None
+        # Shared session so concurrent API calls reuse pooled connections
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=config.max_concurrency,
+            pool_maxsize=config.max_concurrency,
+            max_retries=_ApiRetry(
+                total=max(0, config.retry_attempts - 1),
+                status_forcelist=RETRY_STATUS_CODES,
+                allowed_methods=frozenset(['POST']),
+                respect_retry_after_header=True,
+                raise_on_status=False,
+            ),
+        )
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+        self._cache = SummaryCache(config.cache_file) if config.cache_file else None
         self._load_existing_summaries()
     
+    def __enter__(self) -> "FileProcessor":
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        """Release the HTTP connection pool and the response cache"""
+        self._session.close()
+        if self._cache is not None:
+            self._cache.close()
+    
     def process_files(self, files: List[FileInfo], mode: str = "all") -> List[str]:
         """
         Process files and return list of summary strings.
@@ -72,104 +131,184 @@ class FileProcessor:
         Returns:
             List of formatted summary strings
         """
+        return list(self.iter_summaries(files, mode))
+    
+    def iter_summaries(self, files: List[FileInfo], mode: str = "all") -> Iterator[str]:
+        """Yield formatted summaries one at a time, in input order"""
         if mode == "update":
             files = self._filter_outdated_files(files)
         elif mode == "status":
-            return []  # Status mode doesn't process files
+            return  # Status mode doesn't process files
         
-        summaries = []
-        for file_info in files:
-            summary = self._process_single_file(file_info)
-            if summary:
-                summaries.append(summary)
+        yield from in_input_order(files, self.iter_completed(files))
+    
+    def iter_completed(self, files: List[FileInfo],
+                       on_start: Callable[[FileInfo], None] = None) -> Iterator[Tuple[FileInfo, Optional[str]]]:
+        """
+        Process files concurrently, yielding (file, summary) as each worker finishes.
+        
+        Args:
+            files: Files to process, submitted in order
+            on_start: Called with each file as a worker picks it up
+            
+        Returns:
+            Iterator of (file, formatted summary or None if the file produced none)
+        """
+        # Every summary in a batch shares one timestamp
+        summary_date = datetime.now().replace(microsecond=0)
+        pending_files = iter(files)
+        in_flight = {}
         
-        return summaries
+        # API calls are I/O-bound; keep at most max_concurrency files in flight
+        with ThreadPoolExecutor(max_workers=self.config.max_concurrency) as executor:
+            
+            def submit_next() -> None:
+                file_info = next(pending_files, None)
+                if file_info is not None:
+                    if on_start is not None:
+                        on_start(file_info)
+                    in_flight[executor.submit(self._process_single_file, file_info, summary_date)] = file_info
+            
+            for _ in range(self.config.max_concurrency):
+                submit_next()
+            
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    file_info = in_flight.pop(future)
+                    # Keep the pool busy while the caller handles this result
+                    submit_next()
+                    yield file_info, future.result()
     
-    def write_output(self, new_summaries: List[str], current_files: List[FileInfo] = None) -> None:
-        """Write summaries to output file, merging with existing summaries for current files only"""
-        if not new_summaries and not current_files:
-            return
+    def write_output(self, new_summaries: Iterable[str], current_files: List[FileInfo] = None) -> None:
+        """
+        Write summaries to output file, merging with existing summaries for current files only.
         
+        With current_files, summaries from an iterator are merged into the output
+        while streaming, so they must arrive in relative_path order (as
+        iter_summaries yields them for discovered files); a ValueError is raised
+        otherwise. Lists and other sequences may be in any order.
+        """
         # When current_files is provided, only include summaries for files that still exist
         if current_files:
-            all_summaries = []
-            for file_info in sorted(current_files, key=lambda f: f.relative_path):
-                # Check if we have a newly processed summary for this file
-                found_new = False
-                for summary in new_summaries:
-                    if f"## {file_info.relative_path}\n" in summary:
-                        all_summaries.append(summary)
-                        found_new = True
-                        break
-                
-                # If no new summary, use existing summary if available
-                if not found_new and file_info.relative_path in self.existing_summaries:
-                    existing = self.existing_summaries[file_info.relative_path]
-                    all_summaries.append(self._format_summary(file_info.relative_path, existing.content, existing.summary_date, existing.checksum))
-            summaries_to_write = all_summaries
-            total_count = len(current_files)
+            if isinstance(new_summaries, Sequence):
+                # Already in memory, so order them rather than requiring the caller to
+                new_summaries = sorted(new_summaries, key=lambda summary: _summary_path(summary) or '')
+            ordered_paths = sorted(file_info.relative_path for file_info in current_files)
+            summaries = self._iter_current_summaries(ordered_paths, new_summaries)
+            total_count = len(ordered_paths)
         else:
             # For update mode without current_files list (legacy), merge new summaries with all existing ones
             # This preserves the old behavior when current_files is not provided
-            all_summaries = {}
-            
-            # Add existing summaries
-            for file_path, metadata in self.existing_summaries.items():
-                all_summaries[file_path] = self._format_summary(file_path, metadata.content, metadata.summary_date, metadata.checksum)
-            
-            # Add/update with new summaries
+            new_by_path = {}
             for summary in new_summaries:
-                # Extract file path from summary
-                lines = summary.split('\n')
-                if lines and lines[0].startswith('## '):
-                    file_path = lines[0][3:].strip()
-                    all_summaries[file_path] = summary
+                file_path = _summary_path(summary)
+                if file_path is not None:
+                    new_by_path[file_path] = summary
+            
+            if not new_by_path:
+                return
             
-            # Sort by file path
-            summaries_to_write = [all_summaries[path] for path in sorted(all_summaries.keys())]
-            total_count = len(summaries_to_write)
+            ordered_paths = sorted(set(self.existing_summaries) | set(new_by_path))
+            summaries = ((summary, False) for summary in self._iter_merged_summaries(ordered_paths, new_by_path))
+            total_count = len(ordered_paths)
         
         # Create header with metadata
         header = f"""# Project Summary
 
 Generated by codectx on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 
-Total files processed: {total_count}
+{_TOTAL_FILES_PREFIX}{total_count}
 
 ---
 
 """
         
+        # Write to a temporary file and rename it over the output so a failed
+        # write never leaves a truncated summary file behind
+        temp_file = self.config.output_file + '.tmp'
         try:
-            with open(self.config.output_file, 'w', encoding='utf-8') as file:
+            written = unchanged = 0
+            # Summaries are formatted and written one at a time; the large buffer keeps write calls rare
+            with open(temp_file, 'w', encoding='utf-8', buffering=OUTPUT_BUFFER_SIZE) as file:
                 file.write(header)
-                for summary in summaries_to_write:
+                for summary, is_unchanged in summaries:
                     file.write(summary)
                     if not summary.endswith('\n'):
                         file.write('\n')
                     file.write('\n')  # Extra newline between summaries
+                    written += 1
+                    unchanged += is_unchanged
+            
+            # Every existing summary was written back unchanged under the same header count: keep the current output file
+            if (unchanged == written == len(self.existing_summaries) and total_count == self._existing_total_count
+                    and os.path.exists(self.config.output_file)):
+                os.remove(temp_file)
+                return
+            
+            os.replace(temp_file, self.config.output_file)
         except Exception as e:
+            if os.path.exists(temp_file):
+                os.remove(temp_file)
+            if isinstance(e, ValueError):
+                raise  # Unordered summary stream: a caller error, not a write failure
             raise IOError(f"Failed to write to {self.config.output_file}: {e}")
     
+    def _iter_current_summaries(self, ordered_paths: List[str], new_summaries: Iterable[str]) -> Iterator[Tuple[str, bool]]:
+        """Merge path-ordered new summaries with existing ones, yielding (summary, unchanged)"""
+        new_iter = ((_summary_path(summary), summary) for summary in new_summaries)
+        new_iter = ((path, summary) for path, summary in new_iter if path is not None)
+        pending = next(new_iter, None)
+        previous_path = None
+        
+        for file_path in ordered_paths:
+            existing = self.existing_summaries.get(file_path)
+            existing_summary = self._format_existing_summary(file_path, existing) if existing else None
+            
+            # Prefer a newly processed summary (the last one for a path wins), then fall back to the existing one
+            summary = existing_summary
+            while pending is not None and pending[0] <= file_path:
+                new_path, new_summary = pending
+                if previous_path is not None and new_path < previous_path:
+                    raise ValueError(f"Summaries must be streamed in path order: {new_path} came after {previous_path}")
+                previous_path = new_path
+                if new_path == file_path:
+                    summary = new_summary
+                pending = next(new_iter, None)
+            
+            if summary is not None:
+                yield summary, summary == existing_summary
+    
+    def _iter_merged_summaries(self, ordered_paths: List[str], new_by_path: Dict[str, str]) -> Iterator[str]:
+        """Yield the summary for each path, preferring new ones over existing ones"""
+        for file_path in ordered_paths:
+            summary = new_by_path.get(file_path)
+            if summary is None:
+                existing = self.existing_summaries.get(file_path)
+                if existing is None:
+                    continue
+                summary = self._format_existing_summary(file_path, existing)
+            yield summary
+    
+    def _format_existing_summary(self, file_path: str, existing: SummaryMetadata) -> str:
+        """Format a summary loaded from the existing output file"""
+        return self._format_summary(file_path, existing.content, existing.summary_date, existing.checksum)
+    
     def _format_summary(self, file_path: str, content: str, summary_date: datetime = None, checksum: str = None) -> str:
         """Format a file summary with timestamp and checksum metadata"""
         if summary_date is None:
             summary_date = datetime.now()
         
-        timestamp_str = summary_date.strftime('%Y-%m-%d %H:%M:%S')
+        timestamp_str = summary_date.strftime(SUMMARY_DATE_FORMAT)
         
         # Add checksum to timestamp line if available
         if checksum:
-            timestamp_line = f"Summarized on {timestamp_str} (checksum: {checksum})"
+            timestamp_line = f"{SUMMARY_TIMESTAMP_PREFIX}{timestamp_str}{SUMMARY_CHECKSUM_PREFIX}{checksum})"
         else:
-            timestamp_line = f"Summarized on {timestamp_str}"
+            timestamp_line = f"{SUMMARY_TIMESTAMP_PREFIX}{timestamp_str}"
         
         # Remove duplicate header if content already starts with "## File:"
-        cleaned_content = content
-        if content.startswith(f"## File: {file_path}"):
-            first_line_end = content.find('\n')
-            if first_line_end != -1:
-                cleaned_content = content[first_line_end + 1:].lstrip()
+        cleaned_content = _strip_duplicate_header(content, file_path)
         
         return f"""## {file_path}
 
@@ -179,135 +318,171 @@ Total files processed: {total_count}
     
     def get_file_status(self, files: List[FileInfo]) -> Dict[str, str]:
         """Get status of files (up-to-date, outdated, new) based on checksums"""
-        status = {}
-        for file_info in files:
-            if file_info.relative_path in self.existing_summaries:
-                existing = self.existing_summaries[file_info.relative_path]
-                # Compare checksums instead of dates
-                if existing.checksum and file_info.checksum != existing.checksum:
-                    status[file_info.relative_path] = "outdated"
-                else:
-                    status[file_info.relative_path] = "up-to-date"
-            else:
-                status[file_info.relative_path] = "new"
-        
-        return status
+        return {file_info.relative_path: self._classify(file_info) for file_info in files}
+    
+    def _classify(self, file_info: FileInfo) -> str:
+        """Classify a file as new, outdated or up-to-date against its existing summary"""
+        existing = self.existing_summaries.get(file_info.relative_path)
+        if existing is None:
+            return "new"
+        # Compare checksums instead of dates; summaries without one can't be trusted
+        if not existing.checksum or file_info.checksum != existing.checksum:
+            return "outdated"
+        return "up-to-date"
     
     def _load_existing_summaries(self) -> None:
-        """Load existing summaries from output file"""
+        """Load existing summaries from output file in a single streaming pass"""
         if not os.path.exists(self.config.output_file):
             return
         
         try:
             with open(self.config.output_file, 'r', encoding='utf-8') as file:
-                content = file.read()
-            
-            # Parse summaries using regex - now includes checksum
-            # Pattern matches: ## filepath\n\nSummarized on date (checksum: hash)\n\ncontent
-            pattern = r'## (.+?)\n\nSummarized on (\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})(?: \(checksum: ([a-f0-9]{64}|unreadable)\))?\n\n(.*?)(?=\n## |\Z)'
-            matches = re.findall(pattern, content, re.DOTALL)
-            
-            for file_path, date_str, checksum, summary_content in matches:
-                try:
-                    summary_date = datetime.strptime(date_str, '%Y-%m-%d %H:%M:%S')
-                    self.existing_summaries[file_path] = SummaryMetadata(
-                        file_path=file_path,
-                        summary_date=summary_date,
-                        content=summary_content.strip(),
-                        checksum=checksum or None
-                    )
-                except ValueError:
-                    continue  # Skip malformed dates
+                # Block layout: "## filepath", blank line, "Summarized on date (checksum: hash)", content.
+                # A block starts only where all three header lines line up, so "## " headings
+                # inside copied file content stay part of that file's summary.
+                current_path = None
+                current_date = None
+                current_checksum = None
+                buffer = []
+                in_preamble = True
+                
+                for line in file:
+                    line = line.rstrip('\n')
+                    # The file count lives in the preamble, before the first summary block
+                    if in_preamble and line.startswith(_TOTAL_FILES_PREFIX):
+                        self._existing_total_count = _parse_int(line[len(_TOTAL_FILES_PREFIX):])
+                    
+                    if (line.startswith(SUMMARY_TIMESTAMP_PREFIX) and len(buffer) >= 2
+                            and buffer[-1] == '' and buffer[-2].startswith('## ')):
+                        in_preamble = False
+                        header = buffer[-2]
+                        del buffer[-2:]
+                        self._add_existing_summary(current_path, current_date, current_checksum, buffer)
+                        
+                        # Blocks with a malformed timestamp line are skipped (path stays None)
+                        parsed = _parse_timestamp_line(line)
+                        current_path = header[3:] if parsed else None
+                        current_date, current_checksum = parsed or (None, None)
+                        buffer = []
+                        continue
+                    
+                    buffer.append(line)
+                
+                self._add_existing_summary(current_path, current_date, current_checksum, buffer)
                     
         except Exception as e:
             print(f"Warning: Could not parse existing {self.config.output_file}: {e}")
     
+    def _add_existing_summary(self, file_path: Optional[str], summary_date: Optional[datetime],
+                              checksum: Optional[str], lines: List[str]) -> None:
+        """Record a parsed summary block (ignores the preamble before the first block)"""
+        if file_path is None:
+            return
+        
+        # Interned so the dict key and FileInfo.relative_path are the same object
+        file_path = sys.intern(file_path)
+        self.existing_summaries[file_path] = SummaryMetadata(
+            summary_date=summary_date,
+            content='\n'.join(lines).strip(),
+            checksum=checksum
+        )
+    
     def _filter_outdated_files(self, files: List[FileInfo]) -> List[FileInfo]:
         """Filter to only files that need updating based on checksums"""
-        outdated = []
-        for file_info in files:
-            if file_info.relative_path not in self.existing_summaries:
-                outdated.append(file_info)  # New file
-            else:
-                existing = self.existing_summaries[file_info.relative_path]
-                # Compare checksums instead of dates
-                if not existing.checksum or file_info.checksum != existing.checksum:
-                    outdated.append(file_info)  # Content changed
-        
-        return outdated
+        return [file_info for file_info in files if self._classify(file_info) != "up-to-date"]
     
-    def _process_single_file(self, file_info: FileInfo) -> Optional[str]:
-        """Process a single file and return formatted summary"""
+    def _process_single_file(self, file_info: FileInfo, summary_date: datetime = None) -> Optional[str]:
+        """Process a single file and return formatted summary (stamped with summary_date, default now)"""
         try:
-            # Read file content
-            content = self._read_file(file_info.path)
-            if content is None:
-                return None
-            
-            # Check file size
+            # Check file size before reading so oversize files are never loaded
             file_size_mb = file_info.size / (1024 * 1024)
             if file_size_mb > self.config.max_file_size_mb:
                 summary_content = f"File size ({file_size_mb:.1f}MB) exceeds limit ({self.config.max_file_size_mb}MB)"
-                return self._format_summary(file_info.relative_path, summary_content, checksum=file_info.checksum)
+                return self._format_summary(file_info.relative_path, summary_content, summary_date, file_info.checksum)
+            
+            # Read file content, bounded by the size seen at discovery
+            content = self._read_file(file_info.path, file_info.size)
+            if content is None:
+                return None
             
-            # Estimate token count (rough approximation)
-            token_count = len(content.split()) + len(content) // 4
+            # Estimate token count (rough approximation, no per-word allocation)
+            token_count = len(content) // CHARS_PER_TOKEN
             
             if token_count < self.config.token_threshold or self.config.mode == ProcessingMode.COPY:
                 # Use raw content for small files or copy mode
-                return self._format_summary(file_info.relative_path, content, checksum=file_info.checksum)
+                return self._format_summary(file_info.relative_path, content, summary_date, file_info.checksum)
             else:
                 # Process with AI or mock
                 if self.config.mode == ProcessingMode.MOCK:
                     summary_content = self._generate_mock_summary()
                 else:
-                    summary_content = self._call_ai_api(file_info.relative_path, content)
-                
-                # If API call failed, don't create a summary
-                if summary_content.startswith("Error:"):
-                    return None
+                    ok, summary_content = self._call_ai_api(file_info.relative_path, content, file_info.checksum)
+                    # If API call failed, don't create a summary
+                    if not ok:
+                        return None
                 
-                return self._format_summary(file_info.relative_path, summary_content, checksum=file_info.checksum)
+                return self._format_summary(file_info.relative_path, summary_content, summary_date, file_info.checksum)
         
         except Exception as e:
             # Don't create error summaries - let file remain as "needs update"
             return None
     
-    def _read_file(self, file_path: str) -> Optional[str]:
-        """Read file content with encoding detection"""
-        encodings = ['utf-8', 'latin-1', 'cp1252', 'ascii']
+    def _read_file(self, file_path: str, size_hint: int = -1) -> Optional[str]:
+        """Read file content with binary and encoding detection, reading at most size_hint bytes"""
+        try:
+            with open(file_path, 'rb') as f:
+                size = os.fstat(f.fileno()).st_size
+                if size_hint >= 0:
+                    size = min(size, size_hint)
+                if size > MMAP_THRESHOLD:
+                    raw = _read_mapped(f, size)
+                    if raw is None:
+                        return None  # NUL bytes found before anything was copied
+                else:
+                    raw = f.read(size)
+        except Exception:
+            return None
         
-        for encoding in encodings:
+        # UTF-16 text is full of NUL bytes, so recognise it by its BOM before the binary check
+        if raw.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
             try:
-                with open(file_path, 'r', encoding=encoding) as f:
-                    content = f.read()
-                
-                # Check if this looks like binary content
-                if '\x00' in content or len([c for c in content if ord(c) < 32 and c not in '\n\r\t']) > len(content) * 0.1:
-                    return None  # Skip binary files
-                
-                return content
-            
-            except (UnicodeDecodeError, UnicodeError):
-                continue
-            except Exception:
+                return _normalize_newlines(raw.decode('utf-16'))
+            except UnicodeDecodeError:
                 return None
         
-        return None  # Could not decode with any encoding
+        # Check if this looks like binary content (NUL bytes or >10% control characters),
+        # scanning the raw bytes at C speed before any decoding work
+        control_count = len(raw) - len(raw.translate(None, _CONTROL_BYTES))
+        if b'\x00' in raw or control_count * 10 > len(raw):
+            return None  # Skip binary files
+        
+        # Decode once as UTF-8 (dropping a BOM if present); latin-1 accepts any byte sequence
+        encoding = 'utf-8-sig' if raw.startswith(codecs.BOM_UTF8) else 'utf-8'
+        try:
+            content = raw.decode(encoding)
+        except UnicodeDecodeError:
+            content = raw.decode('latin-1')
+        
+        return _normalize_newlines(content)
     
-    def _call_ai_api(self, file_path: str, content: str) -> str:
-        """Call AI API to generate summary"""
+    def _call_ai_api(self, file_path: str, content: str, checksum: Optional[str] = None) -> Tuple[bool, str]:
+        """
+        Call AI API to generate summary, reusing cached summaries for known content.
+        
+        Returns:
+            (True, summary) on success, (False, error message) on failure
+        """
+        # Only content with a real checksum can be looked up in the cache
+        cacheable = self._cache is not None and checksum not in (None, "unreadable")
+        if cacheable:
+            cached = self._cache.get(self.config.model, file_path, checksum)
+            if cached is not None:
+                return True, cached
+        
         if not self.config.api_key:
-            return "Error: API key not provided"
+            return False, "API key not provided"
         
-        user_prompt = f"""Please analyze this code file and provide a structured summary.
-
-File: {file_path}
-
-Content:
-```
-{content}
-```"""
+        user_prompt = AI_USER_PROMPT_TEMPLATE.format(file_path=file_path, content=content)
 
         headers = {
             'Authorization': f'Bearer {self.config.api_key}',
@@ -317,56 +492,160 @@ Content:
         data = {
             'model': self.config.model,
             'messages': [
-                {'role': 'system', 'content': AI_SYSTEM_PROMPT},
+                _SYSTEM_MESSAGE,
                 {'role': 'user', 'content': user_prompt}
             ],
             'temperature': 0.1,
             'max_tokens': 500
         }
+        # Serialize the request body once instead of on every retry attempt
+        body = json.dumps(data, ensure_ascii=False).encode('utf-8')
         
-        # Retry logic
-        last_error = None
-        for attempt in range(self.config.retry_attempts):
-            try:
-                response = requests.post(
-                    self.config.api_url,
-                    headers=headers,
-                    json=data,
-                    timeout=self.config.timeout
-                )
-                
-                if response.status_code == 200:
-                    result = response.json()
-                    if 'choices' in result and result['choices']:
-                        ai_content = result['choices'][0]['message']['content'].strip()
-                        # Remove duplicate header if AI added one
-                        if ai_content.startswith(f"## File: {file_path}"):
-                            first_line_end = ai_content.find('\n')
-                            if first_line_end != -1:
-                                ai_content = ai_content[first_line_end + 1:].lstrip()
-                        return ai_content
-                    else:
-                        last_error = "No summary available from API"
-                else:
-                    last_error = f"API error {response.status_code}: {response.text}"
-                    
-            except requests.exceptions.Timeout:
-                last_error = f"API request timed out after {self.config.timeout}s"
-            except requests.exceptions.ConnectionError as e:
-                last_error = f"Connection error: {e}"
-            except requests.exceptions.RequestException as e:
-                last_error = f"API request failed: {e}"
-            except Exception as e:
-                last_error = f"Unexpected error: {e}"
+        # Retries and backoff happen in the session's adapter, on the pooled connection
+        try:
+            response = self._session.post(
+                self.config.api_url,
+                headers=headers,
+                data=body,
+                timeout=self.config.timeout
+            )
             
-            if attempt < self.config.retry_attempts - 1:
-                time.sleep(MOCK_PROCESSING_DELAY)  # Brief pause between retries
-        
-        return f"Error: {last_error}"
+            if response.status_code != 200:
+                return False, f"API error {response.status_code}: {response.text}"
+            
+            result = response.json()
+            if 'choices' in result and result['choices']:
+                ai_content = result['choices'][0]['message']['content'].strip()
+                # Remove duplicate header if AI added one
+                ai_content = _strip_duplicate_header(ai_content, file_path)
+                if cacheable:
+                    self._cache.put(self.config.model, file_path, checksum, ai_content)
+                return True, ai_content
+            return False, "No summary available from API"
+            
+        except requests.exceptions.Timeout:
+            return False, f"API request timed out after {self.config.timeout}s"
+        except requests.exceptions.ConnectionError as e:
+            # Read timeouts that exhausted the adapter's retries arrive wrapped in MaxRetryError
+            if _is_read_timeout(e):
+                return False, f"API request timed out after {self.config.timeout}s"
+            return False, f"Connection error: {e}"
+        except requests.exceptions.RequestException as e:
+            return False, f"API request failed: {e}"
+        except Exception as e:
+            return False, f"Unexpected error: {e}"
     
     def _generate_mock_summary(self) -> str:
         """Generate a mock summary for testing with simulated delay"""
-        # Simulate HTTP call time
-        time.sleep(MOCK_PROCESSING_DELAY)
+        # Simulate HTTP call time (tests set mock_delay to 0 to skip it)
+        if self.config.mock_delay > 0:
+            time.sleep(self.config.mock_delay)
         return MOCK_SUMMARY_TEMPLATE
     
+
+
+def in_input_order(files: List[FileInfo], completed: Iterable[Tuple[FileInfo, Optional[str]]]) -> Iterator[str]:
+    """Reorder (file, summary) results from iter_completed into the order of files, skipping empty summaries"""
+    position = {id(file_info): index for index, file_info in enumerate(files)}
+    ready = {}
+    next_index = 0
+    for file_info, summary in completed:
+        ready[position[id(file_info)]] = summary
+        # Release every summary whose predecessors have all finished
+        while next_index in ready:
+            summary = ready.pop(next_index)
+            next_index += 1
+            if summary:
+                yield summary
+
+
+class _ApiRetry(Retry):
+    """Retry policy for API calls: capped exponential backoff with jitter, bounded Retry-After"""
+    
+    def get_backoff_time(self) -> float:
+        # Count only the trailing run of failures, as urllib3 does, but wait before the first retry too
+        failures = len(list(takewhile(lambda entry: entry.redirect_location is None, reversed(self.history))))
+        if failures == 0:
+            return 0
+        delay = RETRY_BACKOFF_BASE * 2 ** (failures - 1)
+        return min(delay + random.uniform(0, RETRY_JITTER), RETRY_MAX_DELAY)
+    
+    def get_retry_after(self, response) -> Optional[float]:
+        # Malformed values (negative, NaN, garbage) fall back to backoff instead of failing the call
+        try:
+            retry_after = super().get_retry_after(response)
+        except InvalidHeader:
+            return None
+        return None if retry_after is None else min(retry_after, RETRY_MAX_DELAY)
+
+
+def _is_read_timeout(error: requests.exceptions.ConnectionError) -> bool:
+    """Whether a requests ConnectionError is a read timeout wrapped in urllib3's MaxRetryError"""
+    cause = error.args[0] if error.args else None
+    return isinstance(getattr(cause, 'reason', None), ReadTimeoutError)
+
+
+def _strip_duplicate_header(content: str, file_path: str) -> str:
+    """Drop a leading "## File: <path>" line that would repeat the summary header"""
+    # Cheap constant-prefix gate first; the path comparison needs no new string
+    if not content.startswith(_FILE_HEADER_PREFIX) or not content.startswith(file_path, len(_FILE_HEADER_PREFIX)):
+        return content
+    
+    first_line_end = content.find('\n')
+    if first_line_end == -1:
+        return content
+    return content[first_line_end + 1:].lstrip()
+
+
+def _read_mapped(f, size: int) -> Optional[bytes]:
+    """Read a large file through mmap, returning None early if it contains NUL bytes"""
+    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        # UTF-16 text legitimately contains NUL bytes, so only reject BOM-less content
+        if mm[:2] not in (codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE) and mm.find(b'\x00', 0, size) != -1:
+            return None
+        return mm[:size]
+    finally:
+        mm.close()
+
+
+def _summary_path(summary: str) -> Optional[str]:
+    """Extract the file path from a formatted summary's "## path" first line"""
+    first_line = summary.split('\n', 1)[0]
+    if first_line.startswith('## '):
+        return first_line[3:].strip()
+    return None
+
+
+def _parse_int(text: str) -> Optional[int]:
+    """Parse a non-negative integer, returning None if malformed"""
+    text = text.strip()
+    return int(text) if text.isdigit() else None
+
+
+def _normalize_newlines(content: str) -> str:
+    """Translate \r\n and \r line endings to \n, like text-mode reading does"""
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    return content
+
+
+def _parse_timestamp_line(line: str) -> Optional[Tuple[datetime, Optional[str]]]:
+    """Parse a "Summarized on date (checksum: hash)" line, returning None if malformed"""
+    # Fixed layout: prefix, fixed-width timestamp, then an optional checksum suffix
+    date_str = line[_DATE_START:_DATE_END]
+    try:
+        summary_date = datetime.strptime(date_str, SUMMARY_DATE_FORMAT)
+    except ValueError:
+        return None
+    
+    suffix = line[_DATE_END:].rstrip()
+    if not suffix:
+        return summary_date, None
+    
+    if suffix.startswith(SUMMARY_CHECKSUM_PREFIX) and suffix.endswith(')'):
+        checksum = suffix[len(SUMMARY_CHECKSUM_PREFIX):-1]
+        if checksum == "unreadable" or (len(checksum) == 64 and not checksum.strip('0123456789abcdef')):
+            return summary_date, checksum
+    
+    return None
\ No newline at end of file
@@ -8,91 +8,113 @@ This module provides rich console UI components including:
 - Progress tracking and completion statistics
 - Consistent styling and formatting across all UI elements
 """
-from typing import List, Dict
+import threading
+from collections import Counter, defaultdict
+from typing import List, Dict, Tuple
 from datetime import datetime
 from rich.console import Console, Group
 from rich.table import Table
 from rich.panel import Panel
 from rich.progress import Progress, TaskID
 from rich.live import Live
+from rich.style import Style
+from rich.text import Text
 
+from . import __version__
 from .discovery import FileInfo, DiscoveryResult
 from .constants import DEFAULT_TABLE_WIDTH, PROCESSING_REFRESH_RATE
 
+# Shared console; creating one probes the terminal, so do it once per process
+_CONSOLE = Console()
 
-def display_welcome() -> None:
-    """Display welcome banner"""
-    console = Console()
-    console.print("\n[bold magenta]Welcome to codectx![/bold magenta]")
-    console.print("""
+# Welcome banner, styled once at import instead of markup-parsed on every call
+_WELCOME_BANNER = Text.assemble(
+    ("\nWelcome to codectx!", "bold magenta"),
+    "\n"
+    """
  ██████╗ ██████╗ ██████╗ ███████╗ ██████╗████████╗██╗  ██╗
 ██╔════╝██╔═══██╗██╔══██╗██╔════╝██╔════╝╚══██╔══╝╚██╗██╔╝
 ██║     ██║   ██║██║  ██║█████╗  ██║        ██║    ╚███╔╝ 
 ██║     ██║   ██║██║  ██║██╔══╝  ██║        ██║    ██╔██╗ 
 ╚██████╗╚██████╔╝██████╔╝███████╗╚██████╗   ██║   ██╔╝ ██╗
  ╚═════╝ ╚═════╝ ╚═════╝ ╚══════╝ ╚═════╝   ╚═╝   ╚═╝  ╚═╝
-""")
-    console.print("[bold cyan]AI-powered code context & summarization tool[/bold cyan]")
-    
-    # Import version here to avoid circular imports
-    try:
-        from . import __version__
-        console.print(f"[dim]Version {__version__}[/dim]\n")
-    except ImportError:
-        console.print("[dim]Version 1.0.0[/dim]\n")
+"""
+    "\n",
+    ("AI-powered code context & summarization tool", "bold cyan"),
+    "\n",
+    (f"Version {__version__}", "dim"),
+    "\n"
+)
+
+# Last formatted console timestamp as (second, markup); messages often come in bursts
+_timestamp_cache = (None, "")
+
+# Status cells and path styles for project file tables, keyed by file status;
+# prebuilt Text and Style objects so rows never go through the markup parser
+_FILE_STATUS_CELLS = {
+    "up-to-date": Text("🔗 Up to date", style="green"),
+    "outdated": Text("⚠️ Needs update", style="yellow"),
+    "new": Text("⏳ Pending", style="blue"),
+}
+_FILE_PATH_STYLE = {"outdated": Style(bold=True), "new": Style(bold=True)}
+_UNKNOWN_STATUS_CELL = Text("Unknown", style="dim")
+
+# Status cells and path styles for the live files table, keyed by processing status
+_LIVE_STATUS_CELLS = {
+    'completed': Text("✅  Complete", style="green"),
+    'processing': Text("🔄  Processing...", style="yellow"),
+    'error': Text("❌  Error", style="red"),
+    'pending': Text("⏳  Pending", style="cyan"),
+}
+_LIVE_PATH_STYLE = {'processing': Style(color="yellow", bold=True), 'error': Style(color="red", dim=True)}
+_DIM = Style(dim=True)
+
+# Live table windowing: lines used by everything but file rows, minimum rows shown,
+# and finished rows kept visible above the first unfinished file
+_LIVE_LAYOUT_OVERHEAD = 14
+_LIVE_MIN_ROWS = 5
+_LIVE_OVERSCAN = 2
+
+
+def display_welcome() -> None:
+    """Display welcome banner"""
+    _CONSOLE.print(_WELCOME_BANNER)
 
 
 def display_info(message: str) -> None:
     """Display info message with timestamp"""
-    console = Console()
     timestamp = _get_timestamp()
-    console.print(f"{timestamp} [cyan]{message}[/cyan]")
+    _CONSOLE.print(f"{timestamp} [cyan]{message}[/cyan]")
 
 
 def display_success(message: str) -> None:
     """Display success message with timestamp"""
-    console = Console()
     timestamp = _get_timestamp()
-    console.print(f"{timestamp} [green]{message}[/green]")
+    _CONSOLE.print(f"{timestamp} [green]{message}[/green]")
 
 
 def display_warning(message: str) -> None:
     """Display warning message with timestamp"""
-    console = Console()
     timestamp = _get_timestamp()
-    console.print(f"{timestamp} [yellow]⚠️ {message}[/yellow]")
+    _CONSOLE.print(f"{timestamp} [yellow]⚠️ {message}[/yellow]")
 
 
 def display_error(message: str) -> None:
     """Display error message with timestamp"""
-    console = Console()
     timestamp = _get_timestamp()
-    console.print(f"{timestamp} [red]❌ Error: {message}[/red]")
+    _CONSOLE.print(f"{timestamp} [red]❌ Error: {message}[/red]")
 
 
 def display_file_stats(discovery: DiscoveryResult, file_status: Dict[str, str]) -> None:
     """Display file statistics"""
-    console = Console()
-    
     # Count files by status
-    status_counts = {"up-to-date": 0, "outdated": 0, "new": 0}
-    for status in file_status.values():
-        if status in status_counts:
-            status_counts[status] += 1
+    status_counts = Counter(file_status.values())
     
-    console.print()
-    console.print("[green]📊 File Analysis Complete[/green]")
-    console.print(f"[green]✅ Up-to-date:[/green] {status_counts['up-to-date']}")
-    console.print(f"[yellow]⚠️  Need updates:[/yellow] {status_counts['outdated']}")
-    console.print(f"[blue]📄 Never processed:[/blue] {status_counts['new']}")
-    console.print(f"[red]🚫 Ignored:[/red] {len(discovery.ignored_files)} | [blue]🎯 Patterns:[/blue] {discovery.ignore_patterns_count}")
-    console.print()
+    _CONSOLE.print(_status_counts_text("📊 File Analysis Complete", discovery, status_counts))
 
 
 def display_file_table(files: List[FileInfo], file_status: Dict[str, str], title: str = "📂 Project Files") -> None:
     """Display file table with status information"""
-    console = Console()
-    
     table = Table(
         title=title,
         show_header=True,
@@ -110,18 +132,8 @@ def display_file_table(files: List[FileInfo], file_status: Dict[str, str], title
         status = file_status.get(file_info.relative_path, "unknown")
         
         # Style based on status
-        if status == "up-to-date":
-            status_display = "[green]🔗 Up to date[/green]"
-            path_display = file_info.relative_path
-        elif status == "outdated":
-            status_display = "[yellow]⚠️ Needs update[/yellow]"
-            path_display = f"[bold]{file_info.relative_path}[/bold]"
-        elif status == "new":
-            status_display = "[blue]⏳ Pending[/blue]"
-            path_display = f"[bold]{file_info.relative_path}[/bold]"
-        else:
-            status_display = "[dim]Unknown[/dim]"
-            path_display = file_info.relative_path
+        status_display = _FILE_STATUS_CELLS.get(status, _UNKNOWN_STATUS_CELL)
+        path_display = _styled_path(file_info.relative_path, _FILE_PATH_STYLE.get(status))
         
         table.add_row(
             path_display,
@@ -130,13 +142,12 @@ def display_file_table(files: List[FileInfo], file_status: Dict[str, str], title
             status_display
         )
     
-    console.print(table)
+    _CONSOLE.print(table)
 
 
 def display_processing_progress(files: List[FileInfo], mode_name: str = "Processing") -> Progress:
     """Start and return progress bar for processing"""
-    console = Console()
-    progress = Progress(console=console)
+    progress = Progress(console=_CONSOLE)
     task = progress.add_task(f"{mode_name} files", total=len(files))
     progress.start()
     return progress
@@ -144,13 +155,32 @@ def display_processing_progress(files: List[FileInfo], mode_name: str = "Process
 
 def create_live_processing_layout(files: List[FileInfo], directory: str, progress: Progress) -> Group:
     """Create a live layout for processing display with real-time file status updates"""
-    
-    # Create processing stats panel
-    total_files = len(files)
-    completed = len([f for f in files if hasattr(f, '_processing_status') and f._processing_status == 'completed'])
-    processing = len([f for f in files if hasattr(f, '_processing_status') and f._processing_status == 'processing'])
+    return Group(
+        _create_live_stats_panel(files, directory),
+        "",
+        _create_live_files_table(files),
+        "",
+        progress
+    )
+
+
+def _create_live_stats_panel(files: List[FileInfo], directory: str) -> Panel:
+    """Create the panel summarizing live processing counts"""
+    status_counts = Counter(f._processing_status for f in files)
+    return Panel(
+        _live_stats_text(directory, status_counts, len(files)),
+        title="📊 Live Status",
+        border_style="blue",
+        padding=(0, 1)
+    )
+
+
+def _live_stats_text(directory: str, status_counts: Dict[str, int], total_files: int) -> str:
+    """Build the live status line from per-status file counts"""
+    completed = status_counts['completed']
+    processing = status_counts['processing']
     pending = total_files - completed - processing
-    errors = len([f for f in files if hasattr(f, '_processing_status') and f._processing_status == 'error'])
+    errors = status_counts['error']
     
     stats_text = (
         f"[bold cyan]📂 Processing:[/bold cyan] {directory}\n"
@@ -162,27 +192,14 @@ def create_live_processing_layout(files: List[FileInfo], directory: str, progres
     if errors > 0:
         stats_text += f" | [red]❌ Errors:[/red] {errors}"
     
-    stats_panel = Panel(
-        stats_text,
-        title="📊 Live Status",
-        border_style="blue",
-        padding=(0, 1)
-    )
-    
-    # Create live file status table
-    files_table = _create_live_files_table(files)
-    
-    return Group(
-        stats_panel,
-        "",
-        files_table,
-        "",
-        progress
-    )
+    return stats_text
 
 
-def _create_live_files_table(files: List[FileInfo]) -> Table:
-    """Create a table showing real-time file processing status"""
+def _create_live_files_table(files: List[FileInfo], start: int = 0, stop: int = None) -> Table:
+    """Create a table showing real-time file processing status for files[start:stop]"""
+    if stop is None:
+        stop = len(files)
+    
     table = Table(
         title="📂 Project Files Overview",
         show_header=True,
@@ -196,24 +213,12 @@ def _create_live_files_table(files: List[FileInfo]) -> Table:
     table.add_column("📅 Modified", justify="center", width=14)
     table.add_column("📊 Status", justify="center", width=22)
     
-    for file_info in files:
-        # Get current processing status
-        status = getattr(file_info, '_processing_status', 'pending')
-        
-        # Map status to display
-        if status == 'completed':
-            status_display = "[green]✅  Complete[/green]"
-            path_display = file_info.relative_path
-        elif status == 'processing':
-            status_display = "[yellow]🔄  Processing...[/yellow]"
-            path_display = f"[bold yellow]{file_info.relative_path}[/bold yellow]"
-        elif status == 'error':
-            status_display = "[red]❌  Error[/red]"
-            path_display = f"[dim red]{file_info.relative_path}[/dim red]"
-        else:  # pending
-            status_display = "[cyan]⏳  Pending[/cyan]"
-            path_display = file_info.relative_path
-        
+    # Rows outside the window are summarized instead of rendered
+    if start > 0:
+        table.add_row(Text(f"... {start} more files above", style=_DIM), "", "", "")
+    
+    for file_info in files[start:stop]:
+        path_display, status_display = _live_row_cells(file_info)
         table.add_row(
             path_display,
             file_info.size_str,
@@ -221,26 +226,52 @@ def _create_live_files_table(files: List[FileInfo]) -> Table:
             status_display
         )
     
+    if stop < len(files):
+        table.add_row(Text(f"... {len(files) - stop} more files below", style=_DIM), "", "", "")
+    
     return table
 
 
+def _live_row_cells(file_info: FileInfo) -> Tuple[Text, Text]:
+    """Path and status cells for a file's row in the live table"""
+    # Get current processing status
+    status = file_info._processing_status
+    
+    # Map status to display
+    status_display = _LIVE_STATUS_CELLS.get(status, _LIVE_STATUS_CELLS['pending'])
+    path_display = _styled_path(file_info.relative_path, _LIVE_PATH_STYLE.get(status))
+    
+    return path_display, status_display
+
+
 def create_live_processing_context(files: List[FileInfo], directory: str):
     """Create a context manager for live processing display"""
-    console = Console()
-    progress = Progress(console=console)
+    progress = Progress(console=_CONSOLE)
     task = progress.add_task("Processing files", total=len(files))
     
-    live = Live(
-        create_live_processing_layout(files, directory, progress),
-        refresh_per_second=PROCESSING_REFRESH_RATE,
-        console=console
-    )
+    # The stats panel and the visible table are kept between frames and only rebuilt when they change
+    stats_panel = _create_live_stats_panel(files, directory)
+    row_index = {file_info.relative_path: row for row, file_info in enumerate(files)}
     
     class LiveContext:
         def __init__(self):
             self.progress = progress
             self.task = task
-            self.live = live
+            self._stats_panel = stats_panel
+            # Only the rows that fit on screen are rendered, starting near the first unfinished file
+            self._cursor = 0
+            self._window = self._visible_range()
+            self._table = _create_live_files_table(files, *self._window)
+            # Rows changed since the last frame; applied together when the next frame is drawn
+            self._dirty_rows = set()
+            # Files per processing status, kept up to date on every transition
+            self._status_counts = Counter(f._processing_status for f in files)
+            self._lock = threading.Lock()
+            self.live = Live(
+                get_renderable=self._render,
+                refresh_per_second=PROCESSING_REFRESH_RATE,
+                console=_CONSOLE
+            )
             
         def __enter__(self):
             self.live.start()
@@ -250,54 +281,75 @@ def create_live_processing_context(files: List[FileInfo], directory: str):
             self.live.stop()
             
         def update_file_status(self, file_info: FileInfo, status: str):
-            """Update the processing status of a file"""
-            file_info._processing_status = status
-            self.live.update(create_live_processing_layout(files, directory, self.progress))
+            """Update the processing status of a file (shown on the next frame)"""
+            with self._lock:
+                if file_info._processing_status == status:
+                    return  # Nothing visible changes
+                self._status_counts[file_info._processing_status] -= 1
+                self._status_counts[status] += 1
+                file_info._processing_status = status
+                self._dirty_rows.add(row_index[file_info.relative_path])
             
         def advance_progress(self):
-            """Advance the progress bar"""
+            """Advance the progress bar (shown on the next frame)"""
             self.progress.advance(self.task)
-            self.live.update(create_live_processing_layout(files, directory, self.progress))
+            
+        def force_flush(self):
+            """Apply pending updates and redraw now instead of on the next frame"""
+            self.live.refresh()
+            
+        def _render(self) -> Group:
+            """Apply the changes since the last frame and return the layout to draw"""
+            with self._lock:
+                dirty_rows, self._dirty_rows = self._dirty_rows, set()
+                if dirty_rows:
+                    self._stats_panel.renderable = _live_stats_text(directory, self._status_counts, len(files))
+            
+            # Files are submitted in order, so the first unfinished file only moves forward
+            while self._cursor < len(files) and files[self._cursor]._processing_status in ('completed', 'error'):
+                self._cursor += 1
+            
+            # Rebuild the visible rows only when the window moved or one of its rows changed
+            window = self._visible_range()
+            start, stop = window
+            if window != self._window or any(start <= row < stop for row in dirty_rows):
+                self._window = window
+                self._table = _create_live_files_table(files, *window)
+            
+            return Group(self._stats_panel, "", self._table, "", progress)
+            
+        def _visible_range(self) -> Tuple[int, int]:
+            """Range of files that fits in the terminal, keeping a few finished files above"""
+            size = max(_CONSOLE.size.height - _LIVE_LAYOUT_OVERHEAD, _LIVE_MIN_ROWS)
+            if len(files) <= size:
+                return 0, len(files)
+            start = max(0, min(self._cursor - _LIVE_OVERSCAN, len(files) - size))
+            return start, start + size
     
     return LiveContext()
 
 
 def display_completion_stats(processed_count: int, output_file: str, up_to_date_count: int = 0) -> None:
     """Display completion statistics"""
-    console = Console()
     timestamp = _get_timestamp()
     
-    console.print()
-    console.print(f"{timestamp} [green]✅ Processing complete! {processed_count} files processed.[/green]")
-    console.print(f"{timestamp} [green]Output written to {output_file}[/green]")
+    _CONSOLE.print()
+    _CONSOLE.print(f"{timestamp} [green]✅ Processing complete! {processed_count} files processed.[/green]")
+    _CONSOLE.print(f"{timestamp} [green]Output written to {output_file}[/green]")
     
     if up_to_date_count > 0:
-        console.print(f"[blue]📄 {up_to_date_count} files were already up to date[/blue]")
+        _CONSOLE.print(f"[blue]📄 {up_to_date_count} files were already up to date[/blue]")
 
 
 def display_status_summary(discovery: DiscoveryResult, file_status: Dict[str, str]) -> None:
     """Display detailed status summary for --status mode"""
-    console = Console()
+    # Partition files by status once; counts and the attention view both come from it
+    files_by_status = _partition_by_status(discovery.files_to_process, file_status)
+    status_counts = Counter({status: len(group) for status, group in files_by_status.items()})
     
-    # Count files by status
-    status_counts = {"up-to-date": 0, "outdated": 0, "new": 0}
-    for status in file_status.values():
-        if status in status_counts:
-            status_counts[status] += 1
-    
-    console.print()
-    console.print("[green]📊 File Status Summary[/green]")
-    console.print(f"[green]✅ Up-to-date:[/green] {status_counts['up-to-date']}")
-    console.print(f"[yellow]⚠️  Need updates:[/yellow] {status_counts['outdated']}")
-    console.print(f"[blue]📄 Never processed:[/blue] {status_counts['new']}")
-    console.print(f"[red]🚫 Ignored:[/red] {len(discovery.ignored_files)} | [blue]🎯 Patterns:[/blue] {discovery.ignore_patterns_count}")
-    console.print()
+    _CONSOLE.print(_status_counts_text("📊 File Status Summary", discovery, status_counts))
     
-    # Filter files that need attention
-    files_needing_attention = [
-        f for f in discovery.files_to_process
-        if file_status.get(f.relative_path) in ["outdated", "new"]
-    ]
+    files_needing_attention = files_by_status['outdated'] + files_by_status['new']
     
     if len(discovery.files_to_process) <= 20:
         # Show all files for small projects
@@ -307,7 +359,7 @@ def display_status_summary(discovery: DiscoveryResult, file_status: Dict[str, st
         _display_summary_panel(discovery, status_counts)
         
         if files_needing_attention:
-            console.print()
+            _CONSOLE.print()
             display_info(f"📋 Files needing attention ({len(files_needing_attention)} of {len(discovery.files_to_process)} total):")
             
             # Show up to 15 files that need attention
@@ -315,18 +367,37 @@ def display_status_summary(discovery: DiscoveryResult, file_status: Dict[str, st
             display_file_table(files_to_show, file_status, "⚠️ Files Requiring Updates")
             
             if len(files_needing_attention) > 15:
-                console.print(f"[dim]... and {len(files_needing_attention) - 15} more files need updates[/dim]")
+                _CONSOLE.print(f"[dim]... and {len(files_needing_attention) - 15} more files need updates[/dim]")
             
-            console.print(f"[dim]Use 'codectx' to update outdated files or 'codectx --scan-all' to process all files[/dim]")
+            _CONSOLE.print(f"[dim]Use 'codectx' to update outdated files or 'codectx --scan-all' to process all files[/dim]")
         else:
-            console.print()
+            _CONSOLE.print()
             display_info("🎉 All files are up-to-date! No action needed.")
 
 
+def _status_counts_text(title: str, discovery: DiscoveryResult, status_counts: Dict[str, int]) -> str:
+    """Build the status count block so it renders in a single print"""
+    return "\n".join([
+        "",
+        f"[green]{title}[/green]",
+        f"[green]✅ Up-to-date:[/green] {status_counts['up-to-date']}",
+        f"[yellow]⚠️  Need updates:[/yellow] {status_counts['outdated']}",
+        f"[blue]📄 Never processed:[/blue] {status_counts['new']}",
+        f"[red]🚫 Ignored:[/red] {len(discovery.ignored_files)} | [blue]🎯 Patterns:[/blue] {discovery.ignore_patterns_count}",
+        "",
+    ])
+
+
+def _partition_by_status(files: List[FileInfo], file_status: Dict[str, str]) -> Dict[str, List[FileInfo]]:
+    """Group files by status in a single pass, keeping discovery order within each group"""
+    files_by_status = defaultdict(list)
+    for file_info in files:
+        files_by_status[file_status.get(file_info.relative_path, "unknown")].append(file_info)
+    return files_by_status
+
+
 def _display_summary_panel(discovery: DiscoveryResult, status_counts: Dict[str, int]) -> None:
     """Display summary panel for large projects"""
-    console = Console()
-    
     stats_text = (
         f"[bold cyan]📂 Directory:[/bold cyan] {discovery.directory}\n"
         f"[green]🔗 Up to date:[/green] {status_counts['up-to-date']} | "
@@ -343,9 +414,20 @@ def _display_summary_panel(discovery: DiscoveryResult, status_counts: Dict[str,
         padding=(0, 1)
     )
     
-    console.print(panel)
+    _CONSOLE.print(panel)
+
+
+def _styled_path(path: str, style: Style = None) -> Text:
+    """Path cell with an optional style (plain Text, so brackets in paths are never read as markup)"""
+    return Text(path, style=style or "")
 
 
 def _get_timestamp() -> str:
-    """Get current timestamp for console output"""
-    return f"[dim]{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}[/dim]"
\ No newline at end of file
+    """Get current timestamp for console output, formatted at most once per second"""
+    global _timestamp_cache
+    now = datetime.now().replace(microsecond=0)
+    cached_second, cached_text = _timestamp_cache
+    if now != cached_second:
+        cached_text = f"[dim]{now.strftime('%Y-%m-%d %H:%M:%S')}[/dim]"
+        _timestamp_cache = (now, cached_text)
+    return cached_text
\ No newline at end of file
@@ -126,7 +126,8 @@ def mock_config():
         timeout=30.0,
         retry_attempts=3,
         max_file_size_mb=10.0,
-        output_file="test-codectx.md"
+        output_file="test-codectx.md",
+        mock_delay=0.0
     )
 
 
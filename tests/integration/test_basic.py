@@ -95,4 +95,12 @@ class TestBasicIntegration:
             assert 'README.md' in updated_content     # Unchanged file still present
             
         finally:
-            os.chdir(original_cwd)
\ No newline at end of file
+            os.chdir(original_cwd)
+            
+    def test_rejects_non_positive_concurrency(self, temp_dir):
+        """Test that --max-concurrency below 1 is rejected at argument parsing"""
+        for value in ('0', '-2'):
+            with patch('sys.argv', ['codectx', '--mock-mode', '--max-concurrency', value, temp_dir]):
+                with pytest.raises(SystemExit) as exc_info:
+                    main()
+            assert exc_info.value.code == 2
\ No newline at end of file
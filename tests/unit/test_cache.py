@@ -0,0 +1,43 @@
+"""
+Unit tests for the cache module
+"""
+import os
+import pytest
+from pathlib import Path
+
+from codectx.cache import SummaryCache
+
+
+class TestSummaryCache:
+    """Test the on-disk summary cache"""
+
+    def test_cache_roundtrip(self, temp_dir):
+        """Test that stored summaries are returned for the same key"""
+        cache = SummaryCache(os.path.join(temp_dir, 'cache.db'))
+
+        assert cache.get('model', 'a.py', 'a' * 64) is None
+        cache.put('model', 'a.py', 'a' * 64, 'summary')
+
+        assert cache.get('model', 'a.py', 'a' * 64) == 'summary'
+        assert cache.get('other-model', 'a.py', 'a' * 64) is None
+
+    def test_cache_keys_include_file_path(self, temp_dir):
+        """Test that identical content at another path is not served the first file's summary"""
+        cache = SummaryCache(os.path.join(temp_dir, 'cache.db'))
+        cache.put('model', 'a.py', 'c' * 64, 'summary of a.py')
+
+        assert cache.get('model', 'b.py', 'c' * 64) is None
+
+    def test_cache_persists_across_instances(self, temp_dir):
+        """Test that summaries survive reopening the cache file"""
+        path = os.path.join(temp_dir, 'cache.db')
+        SummaryCache(path).put('model', 'b.py', 'b' * 64, 'persisted')
+
+        assert SummaryCache(path).get('model', 'b.py', 'b' * 64) == 'persisted'
+
+    def test_cache_file_created_lazily(self, temp_dir):
+        """Test that creating a cache does not touch the filesystem"""
+        path = Path(temp_dir) / 'cache.db'
+        SummaryCache(str(path))
+
+        assert not path.exists()
@@ -0,0 +1,491 @@
+"""
+Unit tests for the processing module
+"""
+import os
+import json
+import threading
+import time
+import pytest
+import requests
+from pathlib import Path
+from unittest.mock import patch, MagicMock
+from urllib3.exceptions import MaxRetryError, ReadTimeoutError
+from urllib3.response import HTTPResponse
+
+from codectx.discovery import discover_files
+from codectx.processing import FileProcessor, ProcessingMode, _ApiRetry
+
+
+@pytest.fixture
+def output_config(mock_config, temp_dir):
+    """Mock configuration writing its output and cache inside the temp directory"""
+    return mock_config._replace(
+        output_file=os.path.join(temp_dir, 'codectx.md'),
+        cache_file=os.path.join(temp_dir, '.codectx-cache.db')
+    )
+
+
+class TestProcessFiles:
+    """Test FileProcessor.process_files"""
+
+    def test_process_files_keeps_input_order(self, temp_dir, sample_files, output_config):
+        """Test that concurrent processing returns summaries in input order"""
+        files = discover_files(temp_dir).files_to_process
+        processor = FileProcessor(output_config._replace(max_concurrency=4))
+
+        summaries = processor.process_files(files)
+
+        # The binary file is skipped, everything else is summarized in order
+        expected = [f.relative_path for f in files if f.relative_path != 'binary_file.bin']
+        assert [s.split('\n', 1)[0][3:] for s in summaries] == expected
+
+    def test_iter_completed_bounds_work_in_flight(self, temp_dir, sample_files, output_config):
+        """Test that files start in input order with at most max_concurrency in flight"""
+        files = discover_files(temp_dir).files_to_process
+        processor = FileProcessor(output_config._replace(max_concurrency=2))
+        process = processor._process_single_file
+        started, running, peak = [], [0], [0]
+        lock = threading.Lock()
+
+        def tracked(file_info, summary_date=None):
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+            time.sleep(0.01)
+            with lock:
+                running[0] -= 1
+            return process(file_info, summary_date)
+
+        with patch.object(processor, '_process_single_file', side_effect=tracked):
+            completed = list(processor.iter_completed(files, on_start=started.append))
+
+        assert started == files
+        assert peak[0] == 2
+        assert sorted(f.relative_path for f, _ in completed) == [f.relative_path for f in files]
+        assert [f.relative_path for f, summary in completed if summary is None] == ['binary_file.bin']
+
+    def test_process_files_status_mode(self, temp_dir, sample_files, output_config):
+        """Test that status mode does not process anything"""
+        files = discover_files(temp_dir).files_to_process
+        processor = FileProcessor(output_config)
+
+        assert processor.process_files(files, mode="status") == []
+
+    def test_process_files_shares_batch_timestamp(self, temp_dir, sample_files, output_config):
+        """Test that all summaries in one batch carry the same timestamp"""
+        files = discover_files(temp_dir).files_to_process
+        processor = FileProcessor(output_config._replace(mode=ProcessingMode.COPY))
+
+        summaries = processor.process_files(files)
+
+        timestamps = {s.split('\n')[2].split(' (checksum')[0] for s in summaries}
+        assert len(timestamps) == 1
+
+    def test_write_output_consumes_summary_iterator(self, temp_dir, sample_files, output_config):
+        """Test that summaries can be streamed straight from processing into the output"""
+        files = discover_files(temp_dir).files_to_process
+        processor = FileProcessor(output_config._replace(mode=ProcessingMode.COPY))
+
+        processor.write_output(processor.iter_summaries(files), files)
+
+        content = Path(output_config.output_file).read_text()
+        assert f"Total files processed: {len(files)}" in content
+        assert "## small.py" in content
+        assert "binary_file.bin" not in content
+
+
+class TestCallAiApi:
+    """Test the AI API call path"""
+
+    def test_call_ai_api_uses_shared_session(self, temp_dir, output_config, mock_api_response):
+        """Test that API calls go through the processor's pooled session"""
+        processor = FileProcessor(output_config)
+
+        response = MagicMock(status_code=200)
+        response.json.return_value = mock_api_response
+        with patch.object(processor._session, 'post', return_value=response) as post:
+            ok, summary = processor._call_ai_api('test.py', 'print("hello")')
+
+        post.assert_called_once()
+        assert ok
+        assert summary.startswith('- **Role**: Test file for unit testing')
+
+    def test_call_ai_api_sends_preserialized_body(self, temp_dir, output_config, mock_api_response):
+        """Test that the JSON body is encoded once and sent as UTF-8 bytes"""
+        config = output_config._replace(cache_file=None)
+        processor = FileProcessor(config)
+
+        ok = MagicMock(status_code=200)
+        ok.json.return_value = mock_api_response
+        with patch.object(processor._session, 'post', return_value=ok) as post:
+            processor._call_ai_api('test.py', 'print("héllo")')
+
+        body = post.call_args.kwargs['data']
+        assert isinstance(body, bytes)
+        assert json.loads(body)['messages'][1]['content'].endswith('print("héllo")\n```')
+
+    def test_session_pool_sized_to_concurrency(self, temp_dir, output_config):
+        """Test that the HTTP pool matches the worker count and is closed on exit"""
+        config = output_config._replace(max_concurrency=12)
+        processor = FileProcessor(config)
+
+        adapter = processor._session.get_adapter('https://test-api.com')
+        assert adapter._pool_maxsize == 12
+
+        with patch.object(processor._session, 'close') as close:
+            with processor:
+                pass
+        close.assert_called_once()
+
+    def test_call_ai_api_reuses_cached_summary(self, temp_dir, output_config, mock_api_response):
+        """Test that a second call for the same checksum skips the API"""
+        processor = FileProcessor(output_config)
+
+        response = MagicMock(status_code=200)
+        response.json.return_value = mock_api_response
+        with patch.object(processor._session, 'post', return_value=response) as post:
+            first = processor._call_ai_api('test.py', 'print("hello")', 'c' * 64)
+            second = processor._call_ai_api('test.py', 'print("hello")', 'c' * 64)
+
+        assert post.call_count == 1
+        assert first == second
+
+    def test_call_ai_api_reports_client_errors(self, temp_dir, output_config):
+        """Test that a failed response is reported as an error summary"""
+        processor = FileProcessor(output_config)
+
+        response = MagicMock(status_code=401, text='Unauthorized')
+        with patch.object(processor._session, 'post', return_value=response) as post:
+            ok, summary = processor._call_ai_api('test.py', 'print("hello")')
+
+        post.assert_called_once()
+        assert not ok
+        assert summary.startswith('API error 401')
+
+    def test_failed_api_call_skips_summary(self, temp_dir, output_config):
+        """Test that only the success flag decides whether a file gets a summary"""
+        processor = FileProcessor(output_config._replace(mode=ProcessingMode.AI_SUMMARIZATION, token_threshold=1))
+        (Path(temp_dir) / 'module.py').write_text('x = 1\n' * 10)
+        file_info = discover_files(temp_dir).files_to_process[0]
+
+        with patch.object(processor, '_call_ai_api', return_value=(False, 'API error 500: busy')):
+            assert processor._process_single_file(file_info) is None
+        with patch.object(processor, '_call_ai_api', return_value=(True, 'Error: handling helpers')):
+            assert processor._process_single_file(file_info).endswith('Error: handling helpers')
+
+    def test_call_ai_api_reports_exhausted_read_timeouts(self, temp_dir, output_config):
+        """Test that a read timeout wrapped by the retry adapter is reported as a timeout"""
+        processor = FileProcessor(output_config)
+
+        error = requests.exceptions.ConnectionError(
+            MaxRetryError(None, '/', ReadTimeoutError(None, '/', 'Read timed out.'))
+        )
+        with patch.object(processor._session, 'post', side_effect=error):
+            ok, message = processor._call_ai_api('test.py', 'print("hello")')
+
+        assert not ok
+        assert message == f"API request timed out after {output_config.timeout}s"
+
+    def test_retry_policy_mounted_on_session(self, temp_dir, output_config):
+        """Test that POSTs are retried by the adapter on rate limiting and server errors only"""
+        processor = FileProcessor(output_config)
+
+        retry = processor._session.get_adapter('https://test-api.com').max_retries
+        assert retry.total == output_config.retry_attempts - 1
+        assert retry.is_retry('POST', 429) and retry.is_retry('POST', 503)
+        assert not retry.is_retry('POST', 401)
+
+    def test_retry_policy_backs_off_exponentially(self):
+        """Test the backoff schedule and its upper bound"""
+        retry = _ApiRetry(total=20)
+        delays = []
+        for _ in range(10):
+            retry = retry.increment('POST', '/', response=HTTPResponse(status=503))
+            delays.append(retry.get_backoff_time())
+
+        assert 1.0 <= delays[0] <= 1.5
+        assert 4.0 <= delays[2] <= 4.5
+        assert delays[-1] == 30.0
+
+    def test_retry_policy_bounds_retry_after(self):
+        """Test that Retry-After is honoured, capped, and ignored when invalid"""
+        retry = _ApiRetry(total=3)
+
+        def retry_after(value):
+            return retry.get_retry_after(HTTPResponse(headers={'Retry-After': value}))
+
+        assert retry_after('7') == 7
+        assert retry_after('3600') == 30.0
+        for value in ('-1', 'nan', 'inf', 'soon'):
+            assert retry_after(value) is None
+
+
+class TestLoadExistingSummaries:
+    """Test parsing of an existing output file"""
+
+    def test_load_existing_summaries(self, temp_dir, output_config):
+        """Test that summary blocks are parsed with dates and checksums"""
+        checksum = 'a' * 64
+        Path(output_config.output_file).write_text(
+            "# Project Summary\n\nGenerated by codectx on 2024-01-01 10:00:00\n\n---\n\n"
+            f"## README.md\n\nSummarized on 2024-01-01 10:00:00 (checksum: {checksum})\n\n"
+            "# Title\n\n## Features\n- Feature 1\n\n"
+            "## small.py\n\nSummarized on 2024-01-02 11:30:00\n\nprint(\"hello\")\n"
+        )
+
+        summaries = FileProcessor(output_config).existing_summaries
+
+        assert set(summaries) == {'README.md', 'small.py'}
+        assert summaries['README.md'].checksum == checksum
+        assert summaries['README.md'].content == "# Title\n\n## Features\n- Feature 1"
+        assert summaries['small.py'].checksum is None
+        assert summaries['small.py'].summary_date.day == 2
+        assert summaries['small.py'].content == 'print("hello")'
+
+    def test_load_skips_malformed_blocks(self, temp_dir, output_config):
+        """Test that blocks with invalid timestamps or checksums are ignored"""
+        Path(output_config.output_file).write_text(
+            "## bad_date.py\n\nSummarized on yesterday\n\ncontent\n\n"
+            "## bad_checksum.py\n\nSummarized on 2024-01-01 10:00:00 (checksum: abc123)\n\ncontent\n\n"
+            "## good.py\n\nSummarized on 2024-01-01 10:00:00 (checksum: unreadable)\n\ncontent\n"
+        )
+
+        summaries = FileProcessor(output_config).existing_summaries
+
+        assert set(summaries) == {'good.py'}
+        assert summaries['good.py'].checksum == 'unreadable'
+
+    def test_written_output_round_trips(self, temp_dir, sample_files, output_config):
+        """Test that write_output produces a file the parser reads back"""
+        files = discover_files(temp_dir).files_to_process
+        processor = FileProcessor(output_config._replace(mode=ProcessingMode.COPY))
+        processor.write_output(processor.process_files(files), files)
+
+        reloaded = FileProcessor(output_config).existing_summaries
+        assert set(reloaded) == {f.relative_path for f in files if f.relative_path != 'binary_file.bin'}
+        assert all(reloaded[f.relative_path].checksum == f.checksum for f in files if f.relative_path in reloaded)
+
+
+class TestFileStatus:
+    """Test checksum-based file classification"""
+
+    def test_status_and_update_filter_agree(self, temp_dir, sample_files, output_config):
+        """Test that get_file_status and the update filter classify files the same way"""
+        files = {f.relative_path: f for f in discover_files(temp_dir).files_to_process}
+        Path(output_config.output_file).write_text(
+            "# Project Summary\n\n---\n\n"
+            f"## small.py\n\nSummarized on 2024-01-01 10:00:00 (checksum: {files['small.py'].checksum})\n\nx\n\n"
+            f"## large.py\n\nSummarized on 2024-01-01 10:00:00 (checksum: {'0' * 64})\n\nx\n\n"
+            "## README.md\n\nSummarized on 2024-01-01 10:00:00\n\nx\n"
+        )
+        processor = FileProcessor(output_config)
+
+        status = processor.get_file_status(list(files.values()))
+
+        assert status['small.py'] == 'up-to-date'
+        assert status['large.py'] == 'outdated'
+        assert status['README.md'] == 'outdated'  # No checksum recorded
+        assert status['config.json'] == 'new'
+        outdated = processor._filter_outdated_files(list(files.values()))
+        assert {f.relative_path for f in outdated} == {p for p, s in status.items() if s != 'up-to-date'}
+
+
+class TestWriteOutput:
+    """Test writing the output file"""
+
+    def test_write_output_skips_unchanged_output(self, temp_dir, sample_files, output_config):
+        """Test that the output file is not rewritten when no summary changed"""
+        files = discover_files(temp_dir).files_to_process
+        copy_config = output_config._replace(mode=ProcessingMode.COPY)
+        processor = FileProcessor(copy_config)
+        processor.write_output(processor.process_files(files), files)
+
+        output = Path(copy_config.output_file)
+        os.utime(output, (0, 0))
+
+        # The binary file never gets a summary, which must not count as a change
+        FileProcessor(copy_config).write_output([], files)
+        assert output.stat().st_mtime == 0
+
+        # A new file without a summary yet changes the header's file count
+        (Path(temp_dir) / 'extra.bin').write_bytes(b'\x00\x01\x02')
+        with_extra = discover_files(temp_dir).files_to_process
+        FileProcessor(copy_config).write_output([], with_extra)
+        assert output.stat().st_mtime != 0
+        assert f"Total files processed: {len(with_extra)}" in output.read_text()
+        os.utime(output, (0, 0))
+
+        # Removing a file from the project does rewrite the output
+        remaining = [f for f in files if f.relative_path != 'small.py']
+        FileProcessor(copy_config).write_output([], remaining)
+        assert output.stat().st_mtime != 0
+        assert 'small.py' not in FileProcessor(copy_config).existing_summaries
+
+
+    def test_write_output_merges_streamed_summaries(self, temp_dir, sample_files, output_config):
+        """Test that path-ordered new summaries are merged into the existing output while streaming"""
+        files = discover_files(temp_dir).files_to_process
+        copy_config = output_config._replace(mode=ProcessingMode.COPY)
+        processor = FileProcessor(copy_config)
+        processor.write_output(processor.process_files(files), files)
+
+        processor = FileProcessor(copy_config)
+        new_summaries = iter([
+            processor._format_summary('gone.py', 'stale'),  # Not a current file
+            processor._format_summary('large.py', 'updated large'),
+            processor._format_summary('small.py', 'updated small'),
+        ])
+        processor.write_output(new_summaries, files)
+
+        existing = FileProcessor(copy_config).existing_summaries
+        assert existing['large.py'].content == 'updated large'
+        assert existing['small.py'].content == 'updated small'
+        assert existing['README.md'].content.startswith('# Test Project')
+        assert 'gone.py' not in existing
+        assert list(existing) == sorted(existing)
+
+    def test_write_output_accepts_unordered_list(self, temp_dir, sample_files, output_config):
+        """Test that a list of summaries may come in any order"""
+        files = discover_files(temp_dir).files_to_process
+        processor = FileProcessor(output_config._replace(mode=ProcessingMode.COPY))
+        summaries = processor.process_files(files)
+
+        processor.write_output(list(reversed(summaries)), files)
+
+        existing = FileProcessor(output_config).existing_summaries
+        assert list(existing) == [s.split('\n', 1)[0][3:] for s in summaries]
+
+    def test_write_output_rejects_unordered_stream(self, temp_dir, sample_files, output_config):
+        """Test that an out-of-order summary stream fails loudly and keeps the previous output"""
+        output = Path(output_config.output_file)
+        output.write_text('previous output')
+        files = discover_files(temp_dir).files_to_process
+        processor = FileProcessor(output_config)
+
+        summaries = iter([
+            processor._format_summary('small.py', 'small'),
+            processor._format_summary('large.py', 'large'),
+        ])
+        with pytest.raises(ValueError, match='path order'):
+            processor.write_output(summaries, files)
+
+        assert output.read_text() == 'previous output'
+        assert not Path(output_config.output_file + '.tmp').exists()
+
+
+    def test_write_output_failure_keeps_previous_file(self, temp_dir, sample_files, output_config):
+        """Test that a failed write leaves the previous output untouched"""
+        output = Path(output_config.output_file)
+        output.write_text('previous output')
+        files = discover_files(temp_dir).files_to_process
+        processor = FileProcessor(output_config._replace(mode=ProcessingMode.COPY))
+
+        with patch('codectx.processing.os.replace', side_effect=OSError('disk full')):
+            with pytest.raises(IOError):
+                processor.write_output(processor.process_files(files), files)
+
+        assert output.read_text() == 'previous output'
+        assert not Path(output_config.output_file + '.tmp').exists()
+
+
+class TestProcessSingleFile:
+    """Test processing of individual files"""
+
+    def test_format_summary_strips_duplicate_header(self, temp_dir, output_config):
+        """Test that a leading "## File:" line for the same path is dropped"""
+        processor = FileProcessor(output_config)
+
+        summary = processor._format_summary('a.py', '## File: a.py\n\nBody')
+        assert summary.endswith('\n\nBody')
+        assert '## File:' not in summary
+
+        # A header for another path is kept
+        summary = processor._format_summary('a.py', '## File: b.py\nBody')
+        assert summary.endswith('## File: b.py\nBody')
+
+    def test_scan_all_regenerates_unchanged_files(self, temp_dir, sample_files, output_config):
+        """Test that processing a file again regenerates its summary even if its checksum is unchanged"""
+        files = {f.relative_path: f for f in discover_files(temp_dir).files_to_process}
+        processor = FileProcessor(output_config)
+        processor.write_output(processor.process_files(list(files.values())), list(files.values()))
+
+        # A mock placeholder from the earlier run is replaced by a copy-mode summary
+        processor = FileProcessor(output_config._replace(mode=ProcessingMode.COPY))
+        summary = processor._process_single_file(files['large.py'])
+
+        assert 'Large Python file for testing AI summarization' in summary
+        assert 'Large Python file' not in processor.existing_summaries['large.py'].content
+
+    def test_oversize_file_is_not_read(self, temp_dir, sample_files, output_config):
+        """Test that files above the size limit are rejected before reading"""
+        files = {f.relative_path: f for f in discover_files(temp_dir).files_to_process}
+        processor = FileProcessor(output_config._replace(max_file_size_mb=0.0001))
+
+        with patch.object(processor, '_read_file') as read_file:
+            summary = processor._process_single_file(files['large.py'])
+
+        read_file.assert_not_called()
+        assert 'exceeds limit' in summary
+
+    def test_read_file_detects_binary(self, temp_dir, output_config):
+        """Test that NUL bytes and dense control characters mark files as binary"""
+        processor = FileProcessor(output_config)
+        nul_file = Path(temp_dir) / 'nul.dat'
+        nul_file.write_bytes(b'text\x00more text')
+        control_file = Path(temp_dir) / 'control.dat'
+        control_file.write_bytes(b'\x01\x02\x03abcdefgh')
+
+        assert processor._read_file(str(nul_file)) is None
+        assert processor._read_file(str(control_file)) is None
+
+    def test_read_file_maps_large_files(self, temp_dir, output_config):
+        """Test that files above the mmap threshold are read and scanned correctly"""
+        processor = FileProcessor(output_config)
+        text_path = Path(temp_dir) / 'large.txt'
+        text_path.write_bytes(b'line\r\n' * 100000)
+        binary_path = Path(temp_dir) / 'large.bin'
+        binary_path.write_bytes(b'a' * 500000 + b'\x00')
+
+        assert processor._read_file(str(text_path)) == 'line\n' * 100000
+        assert processor._read_file(str(text_path), 10) == 'line\nline'
+        assert processor._read_file(str(binary_path)) is None
+
+    def test_read_file_normalizes_line_endings(self, temp_dir, output_config):
+        """Test that text files are returned with \\n line endings"""
+        processor = FileProcessor(output_config)
+        text_file = Path(temp_dir) / 'windows.txt'
+        text_file.write_bytes(b'line one\r\nline two\rline three\n')
+
+        assert processor._read_file(str(text_file)) == 'line one\nline two\nline three\n'
+
+    def test_read_file_encodings(self, temp_dir, output_config):
+        """Test BOM handling and the latin-1 fallback for non UTF-8 files"""
+        processor = FileProcessor(output_config)
+        cases = {
+            'bom.txt': b'\xef\xbb\xbfhello',
+            'utf16.txt': 'hello'.encode('utf-16'),
+            'latin1.txt': 'caf\xe9'.encode('latin-1'),
+        }
+        for name, data in cases.items():
+            (Path(temp_dir) / name).write_bytes(data)
+
+        assert processor._read_file(str(Path(temp_dir) / 'bom.txt')) == 'hello'
+        assert processor._read_file(str(Path(temp_dir) / 'utf16.txt')) == 'hello'
+        assert processor._read_file(str(Path(temp_dir) / 'latin1.txt')) == 'caf\xe9'
+
+    def test_token_threshold_uses_character_estimate(self, temp_dir, output_config):
+        """Test that files under threshold * 4 characters are copied as-is"""
+        processor = FileProcessor(output_config._replace(token_threshold=10))
+        short_file = Path(temp_dir) / 'short.txt'
+        short_file.write_text('word ' * 7)  # 35 chars -> 8 tokens
+        long_file = Path(temp_dir) / 'long.txt'
+        long_file.write_text('x' * 40)  # 40 chars -> 10 tokens
+        files = {f.relative_path: f for f in discover_files(temp_dir).files_to_process}
+
+        with patch.object(processor, '_generate_mock_summary', return_value='mocked') as mock_summary:
+            short_summary = processor._process_single_file(files['short.txt'])
+            long_summary = processor._process_single_file(files['long.txt'])
+
+        assert mock_summary.call_count == 1
+        assert short_summary.endswith('word ' * 7)
+        assert long_summary.endswith('mocked')
@@ -0,0 +1,114 @@
+"""
+Unit tests for the UI module
+"""
+import io
+import pytest
+from pathlib import Path
+from rich.console import Console
+
+from codectx.discovery import discover_files
+from codectx.ui import create_live_processing_context, _partition_by_status
+
+
+@pytest.fixture
+def live_files(temp_dir, sample_files):
+    """Discovered sample files for the live display"""
+    return discover_files(temp_dir).files_to_process
+
+
+def _render_lines(renderable):
+    """Render to plain text lines on a wide, colourless console"""
+    console = Console(file=io.StringIO(), width=200, color_system=None)
+    console.print(renderable)
+    return console.file.getvalue().splitlines()
+
+
+def _row_for(lines, file_info):
+    """The rendered table line for a file"""
+    return next(line for line in lines if f' {file_info.relative_path} ' in line)
+
+
+class TestLiveProcessingContext:
+    """Test the live processing display"""
+
+    def test_update_redraws_affected_row(self, temp_dir, live_files):
+        """Test that a status update shows up in the affected row only"""
+        with create_live_processing_context(live_files, temp_dir) as live_ctx:
+            live_ctx.update_file_status(live_files[1], 'processing')
+            live_ctx.force_flush()
+            lines = _render_lines(live_ctx._table)
+
+        assert 'Processing' in _row_for(lines, live_files[1])
+        assert all('Pending' in _row_for(lines, f) for f in live_files if f is not live_files[1])
+
+    def test_updates_are_applied_per_frame(self, temp_dir, live_files):
+        """Test that status changes are batched until the next frame is drawn"""
+        # Not started, so no refresh thread draws frames behind the test's back
+        live_ctx = create_live_processing_context(live_files, temp_dir)
+
+        live_ctx.update_file_status(live_files[0], 'processing')
+        live_ctx.update_file_status(live_files[0], 'completed')
+        assert 'Pending' in _row_for(_render_lines(live_ctx._table), live_files[0])
+
+        live_ctx.force_flush()
+        assert 'Complete' in _row_for(_render_lines(live_ctx._table), live_files[0])
+
+    def test_live_table_shows_only_visible_rows(self, temp_dir, monkeypatch):
+        """Test that large runs render a window of rows that follows processing"""
+        for i in range(40):
+            (Path(temp_dir) / f'file_{i:02d}.py').write_text(f'x = {i}')
+        files = discover_files(temp_dir).files_to_process
+        monkeypatch.setenv('LINES', '20')  # Leaves room for 6 file rows
+
+        live_ctx = create_live_processing_context(files, temp_dir)
+        text = '\n'.join(_render_lines(live_ctx._table))
+        assert sum(f' {f.relative_path} ' in text for f in files) == 6
+        assert '34 more files below' in text
+
+        for file_info in files[:5]:
+            live_ctx.update_file_status(file_info, 'completed')
+        live_ctx.force_flush()
+
+        text = '\n'.join(_render_lines(live_ctx._table))
+        assert '3 more files above' in text
+        assert f' {files[2].relative_path} ' not in text
+        assert f' {files[3].relative_path} ' in text
+        assert '31 more files below' in text
+
+    def test_stats_line_tracks_status_counts(self, temp_dir, live_files):
+        """Test that the stats line counts follow status transitions"""
+        live_ctx = create_live_processing_context(live_files, temp_dir)
+
+        live_ctx.update_file_status(live_files[0], 'processing')
+        live_ctx.update_file_status(live_files[1], 'processing')
+        live_ctx.update_file_status(live_files[0], 'completed')
+        live_ctx.update_file_status(live_files[1], 'error')
+        live_ctx.force_flush()
+
+        stats_text = live_ctx._stats_panel.renderable
+        assert 'Completed:[/green] 1 ' in stats_text
+        assert 'Processing:[/yellow] 0 ' in stats_text
+        assert 'Errors:[/red] 1' in stats_text
+
+    def test_unchanged_status_marks_nothing_dirty(self, temp_dir, live_files):
+        """Test that re-setting the current status leaves nothing to redraw"""
+        live_ctx = create_live_processing_context(live_files, temp_dir)
+
+        live_ctx.update_file_status(live_files[0], 'pending')
+
+        assert not live_ctx._dirty_rows
+
+
+class TestStatusSummary:
+    """Test the --status summary helpers"""
+
+    def test_partition_by_status_keeps_discovery_order(self, live_files):
+        """Test that files are grouped by status in one pass without reordering"""
+        statuses = ['new', 'up-to-date', 'outdated', 'new']
+        file_status = {f.relative_path: status for f, status in zip(live_files, statuses)}
+
+        files_by_status = _partition_by_status(live_files[:4], file_status)
+
+        assert files_by_status['new'] == [live_files[0], live_files[3]]
+        assert files_by_status['outdated'] == [live_files[2]]
+        assert files_by_status['up-to-date'] == [live_files[1]]